@@ -1,38 +1,356 @@
-from typing import List, Dict, Union, Optional
-from functools import partial
-import requests
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Iterable, Iterator, List, Dict, Union, Optional
+from functools import lru_cache
+from itertools import islice
+from array import array
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import math
+import pathlib
+import random
+import shutil
+import threading
 import time
+import unicodedata
+import uuid
 
-import geopy
-from geopy.geocoders import Nominatim
-from geopy.extra.rate_limiter import RateLimiter
+import aiohttp
+import yarl
+from diskcache import Cache
 
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+# geopy is only imported when geocoding is first needed, see 'NasaPowerCities._get_geolocator', and
+# Selenium only when the parameters have to be scraped, see '_scrape_nasapower_params'
+if TYPE_CHECKING:
+    import pandas
+    from geopy.extra.rate_limiter import AsyncRateLimiter
+    from geopy.geocoders import Nominatim
+    from geopy.location import Location
+    from selenium import webdriver
+
+# Optional faster JSON decoding of the NASA POWER responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".nasa_power_query"
+GEOCACHE_TTL = 7 * 24 * 3600    # One week, in seconds
+GEOCACHE_MISS_TTL = 300    # Failed lookups are only remembered for 5 minutes
+GEOCODE_MAX_RETRIES = 5
+GEOCODE_BACKOFF_SECONDS = 2.0    # Retry n waits BACKOFF_SECONDS * 2**n seconds plus up to 1s of jitter
+
+NASA_POWER_CLIMATOLOGY_URL = yarl.URL("https://power.larc.nasa.gov/api/temporal/climatology/point")
+NASA_POWER_PARAMETERS_URL = "https://power.larc.nasa.gov/api/system/manager/parameters"
+NASA_POWER_MAX_CONNECTIONS = 16    # Concurrent connections to the NASA POWER host
+NASA_POWER_TIMEOUT = 30    # Total timeout of a single climatology request, in seconds
+# Streamed downloads can legitimately take longer, only a stalled connection or read times them out
+NASA_POWER_STREAM_TIMEOUT = aiohttp.ClientTimeout(
+    total=None, sock_connect=NASA_POWER_TIMEOUT, sock_read=NASA_POWER_TIMEOUT
+)
+NASA_POWER_RETRY_STATUSES = (429, 502, 503, 504)
+NASA_POWER_MAX_RETRIES = 5
+NASA_POWER_BACKOFF_FACTOR = 0.3    # Retry n waits BACKOFF_FACTOR * 2**n seconds
+NASA_POWER_MAX_RETRY_AFTER = NASA_POWER_TIMEOUT    # Longer 'Retry-After' delays fail the request
+NASA_POWER_REQUESTS_PER_SECOND = 1    # Request rate to the NASA POWER host, a public API with no documented higher limit
+NASA_POWER_MAX_PARAMETERS = 20    # Maximum number of parameters per climatology query
+NASA_POWER_STREAM_CHUNK_SIZE = 64 * 1024    # Read size when streaming a response to a file, in bytes
+NASA_POWER_FILE_SUFFIXES = {"CSV": ".csv", "ASCII": ".txt", "NETCDF": ".nc", "ICASA": ".icasa"}
+CLIMCACHE_TTL = 30 * 24 * 3600    # One month, in seconds
+PARAMCACHE_TTL = 30 * 24 * 3600    # One month, in seconds
+
+logger = logging.getLogger(__name__)
+
+# GeckoDriver binary path, resolved (and downloaded if needed) once per process
+_GECKODRIVER_PATH: Optional[str] = None
+
+# In-process memo of 'get_nasapower_params' results, on top of its persistent cache
+_NASAPOWER_PARAMS_MEMO: Dict[tuple, Dict[str, str]] = {}
+
+# Persistent event loop so that HTTP sessions opened on it stay usable (and kept alive) between calls.
+# It runs in its own daemon thread so that it also works when the caller already runs an event loop (e.g. Jupyter).
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_EVENT_LOOP_THREAD: Optional[threading.Thread] = None
+_EVENT_LOOP_LOCK = threading.Lock()
+_ASYNC_CLEANUPS: List[Callable[[], Awaitable[Any]]] = []
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Retrieves the module's persistent event loop, starting it in a daemon thread on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running event loop.
+    """
+    global _EVENT_LOOP, _EVENT_LOOP_THREAD
+    with _EVENT_LOOP_LOCK:
+        if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+            _EVENT_LOOP = asyncio.new_event_loop()
+            _EVENT_LOOP_THREAD = threading.Thread(
+                target=_EVENT_LOOP.run_forever, name="nasa_power_query-event-loop", daemon=True
+            )
+            _EVENT_LOOP_THREAD.start()
+        return _EVENT_LOOP
+
+
+def _run(coro: Coroutine) -> Any:
+    """
+    Runs a coroutine to completion on the module's persistent event loop and waits for its result.
+
+    Args:
+        coro (Coroutine): The coroutine to run.
+
+    Returns:
+        Any: The value returned by the coroutine.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_event_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()    # e.g. KeyboardInterrupt, do not leave the coroutine running in the background
+        raise
+
+
+def _chunked(seq: Iterable, n: int) -> Iterator[list]:
+    """
+    Splits an iterable into consecutive lists of at most n elements.
+
+    Args:
+        seq (Iterable): The iterable to split.
+        n (int): The maximum size of each chunk.
+
+    Returns:
+        Iterator[list]: An iterator over the chunks.
+    """
+    it = iter(seq)
+    while chunk := list(islice(it, n)):
+        yield chunk
+
+
+class _AsyncTokenBucket:
+    """
+    Token bucket rate limiter for coroutines.
+
+    Up to 'capacity' requests go through at once, then 'rate' requests per second: callers only
+    wait when the bucket is empty.
+    """
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+            self._tokens = 0
+            self._updated = time.monotonic()
+
+
+_NASA_POWER_LIMITER = _AsyncTokenBucket(NASA_POWER_REQUESTS_PER_SECOND, 1)
+
+
+async def _get_with_retries(
+    session: aiohttp.ClientSession,
+    url: Union[str, yarl.URL],
+    params: Optional[dict]=None,
+    dest: Optional[pathlib.Path]=None
+) -> Union[bytes, pathlib.Path]:
+    """
+    Sends a GET request and returns the response body (or writes it to 'dest'), retrying with
+    exponential back-off on connection errors, timeouts and when the server answers with one of
+    NASA_POWER_RETRY_STATUSES. A 429 response carrying a 'Retry-After' delay in seconds is retried
+    after that delay instead, or fails right away if the delay exceeds NASA_POWER_MAX_RETRY_AFTER.
+    Every attempt goes through the shared NASA POWER rate limiter.
+
+    Args:
+        session (aiohttp.ClientSession): The session used to send the request.
+        url (Union[str, yarl.URL]): The URL to request.
+        params (Optional[dict], optional): Additional query parameters. Defaults to None.
+        dest (Optional[pathlib.Path], optional): A file to stream the body to, in chunks of NASA_POWER_STREAM_CHUNK_SIZE,
+            instead of reading it in memory. The request then uses NASA_POWER_STREAM_TIMEOUT instead of the
+            session timeout. Defaults to None.
+
+    Returns:
+        Union[bytes, pathlib.Path]: The body of the response, or 'dest' once the body is written to it.
+
+    Raises:
+        aiohttp.ClientError: If the request fails, still returns an error status after all retries or
+            asks to retry after more than NASA_POWER_MAX_RETRY_AFTER seconds.
+        asyncio.TimeoutError: If the request still times out after all retries.
+    """
+    timeout = NASA_POWER_STREAM_TIMEOUT if dest is not None else session.timeout
+    for attempt in range(NASA_POWER_MAX_RETRIES + 1):
+        last_attempt = attempt == NASA_POWER_MAX_RETRIES
+        delay = NASA_POWER_BACKOFF_FACTOR * 2 ** attempt
+        await _NASA_POWER_LIMITER.acquire()
+        try:
+            async with session.get(url, params=params, timeout=timeout) as resp:
+                if resp.status not in NASA_POWER_RETRY_STATUSES or last_attempt:
+                    resp.raise_for_status()
+                    if dest is None:
+                        return await resp.read()
+                    # Written to a file of its own next to 'dest' then renamed, so an interrupted download never
+                    # leaves a truncated file and concurrent downloads of the same query never share a file
+                    partial = dest.with_name(f"{dest.name}.{uuid.uuid4().hex}.part")
+                    try:
+                        with open(partial, "xb") as f:
+                            async for block in resp.content.iter_chunked(NASA_POWER_STREAM_CHUNK_SIZE):
+                                f.write(block)
+                        partial.replace(dest)
+                    except BaseException:
+                        partial.unlink(missing_ok=True)
+                        raise
+                    return dest
+                if resp.status == 429:
+                    try:
+                        retry_after = float(resp.headers.get("Retry-After", ""))
+                    except ValueError:
+                        retry_after = None    # Missing or HTTP-date 'Retry-After', keep the exponential back-off
+                    if retry_after is not None:
+                        if retry_after > NASA_POWER_MAX_RETRY_AFTER:
+                            resp.raise_for_status()
+                        delay = max(retry_after, 0)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+        await asyncio.sleep(delay)
+
+
+def _climatology_cache_key(url: yarl.URL) -> str:
+    """
+    Builds the climatology cache key of a NASA POWER query.
+
+    The key covers the endpoint and the whole query string, with the parameters sorted. Coordinates
+    are already rounded to 4 decimals (~11 m) in the URL so small geocoding variations still hit the cache.
+
+    Args:
+        url (yarl.URL): The URL of a single climatology request.
+
+    Returns:
+        str: A hex digest identifying the query.
+    """
+    query = dict(url.query)
+    query["parameters"] = sorted(query["parameters"].split(","))
+    query["endpoint"] = str(url.with_query(None))
+    return hashlib.blake2b(json.dumps(query, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _merge_climatologies(responses: List[dict]) -> dict:
+    """
+    Merges the JSON responses of several parameter chunks for the same point into a single response.
+
+    Args:
+        responses (List[dict]): The JSON responses, all for the same point and year range.
+
+    Returns:
+        dict: The first response updated with the parameter values and metadata of the others.
+    """
+    merged = responses[0]
+    for response in responses[1:]:
+        merged["properties"]["parameter"].update(response["properties"]["parameter"])
+        merged["parameters"].update(response["parameters"])
+    return merged
+
+
+@atexit.register
+def _close_event_loop() -> None:
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        return
+    for cleanup in _ASYNC_CLEANUPS:
+        asyncio.run_coroutine_threadsafe(cleanup(), _EVENT_LOOP).result()
+    _ASYNC_CLEANUPS.clear()
+    _EVENT_LOOP.call_soon_threadsafe(_EVENT_LOOP.stop)
+    _EVENT_LOOP_THREAD.join()
+    _EVENT_LOOP.close()
+
+
+class _GeoCache:
+    """
+    Persistent on-disk cache of geocoding results keyed by normalized city name and geocoding options,
+    since options such as 'language' or 'country_codes' change the result.
+
+    Each entry is stored as an (address, latitude, longitude, raw) tuple. Failed lookups are stored
+    as a ("miss", timestamp) tuple with a short expiry so they get retried later.
+    """
+    def __init__(self, directory: Union[str, pathlib.Path], ttl: Optional[float]) -> None:
+        self._cache = Cache(str(directory))
+        self._ttl = ttl
+
+    @staticmethod
+    def key(name: str) -> str:
+        return unicodedata.normalize("NFKC", name).strip().casefold()
+
+    def _cache_key(self, name: str, options: dict) -> tuple:
+        return ("nominatim", self.key(name), tuple(sorted(options.items())))
+
+    def get(self, name: str, options: dict) -> Optional[tuple]:
+        return self._cache.get(self._cache_key(name, options))
+
+    def set(self, name: str, location: "Location", options: dict) -> tuple:
+        payload = (location.address, location.latitude, location.longitude, location.raw)
+        self._cache.set(self._cache_key(name, options), payload, expire=self._ttl)
+        return payload
+
+    def set_miss(self, name: str, options: dict) -> None:
+        self._cache.set(self._cache_key(name, options), ("miss", time.time()), expire=GEOCACHE_MISS_TTL)
+
+    @staticmethod
+    def is_miss(payload: tuple) -> bool:
+        return payload[0] == "miss"
 
 
 class NasaPowerCities:
-    def __init__(self, names: List[str]) -> None:
+    __slots__ = (
+        "_names", "_name_index", "_name_keys", "_unique_names", "_lat", "_lon", "_geocache", "_climcache",
+        "_climfiles_dir", "_addresses", "_geodetails", "_georecords", "_resolved", "_resolved_options",
+        "_climatologies",
+    )
+
+    _geolocator = None    # Shared Nominatim geolocator, see '_get_geolocator'
+    _session = None    # Shared NASA POWER HTTP session, see '_get_session'
+
+    def __init__(self, 
+        names: List[str],
+        cache_dir: Optional[Union[str, pathlib.Path]]=None,
+        cache_ttl: Optional[float]=GEOCACHE_TTL
+    ) -> None:
         """
         Initializes a new instance of the NasaPowerCities class.
 
         Args:
-            names (List[str]): A list of city names to be handled.
+            names (List[str]): A list (or any iterable) of city names to be handled, or a single city name.
+            cache_dir (Optional[Union[str, pathlib.Path]], optional): The root directory of the persistent geocoding
+                ('geocache') and climatology ('climcache') caches, and of the downloaded climatology files
+                ('climatologies'). Defaults to '~/.nasa_power_query'.
+            cache_ttl (Optional[float], optional): How long a cached geocoding result stays valid, in seconds.
+                None never expires. Defaults to one week.
 
         Returns:
             None
         """
         self._names = self._validate_names(names)
+        self._index_names()
+
+        cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self._geocache = _GeoCache(cache_dir / "geocache", cache_ttl)
+        self._climcache = Cache(str(cache_dir / "climcache"))
+        self._climfiles_dir = (cache_dir / "climatologies").resolve()
 
         self._addresses = None
-        self._coordinates = None
         self._geodetails = None
+        self._georecords = None
+        self._resolved = {}    # Geocoding results of already resolved cities, by normalized name
+        self._resolved_options = {}    # Geocoding options the '_resolved' results were obtained with
 
         self._climatologies = None
     
@@ -41,6 +359,9 @@ class NasaPowerCities:
         """
         Retrieves or sets the names attributes corresponding to list of names of cities
 
+        Setting the names keeps the geocoding details and climatologies of the cities that remain and
+        drops those of the removed ones.
+
         Args:
             value (List[str]): The new list of cities names.
 
@@ -51,7 +372,20 @@ class NasaPowerCities:
     
     @names.setter
     def names(self, value: List[str]) -> None:     
+        coordinates = self.coordinates
         self._names = self._validate_names(value)
+        self._index_names(coordinates)
+
+        # Keep the other per-city attributes consistent with 'coordinates': only the remaining cities
+        if self._georecords is not None:
+            records = {record["name"]: record for record in self._georecords}
+            self._georecords = [records[city] for city in self._names if city in records]
+            self._addresses = [record["address"] for record in self._georecords]
+            self._geodetails = {city: self._geodetails[city] for city in self._names if city in self._geodetails}
+        if self._climatologies is not None:
+            self._climatologies = {
+                city: self._climatologies[city] for city in self._names if city in self._climatologies
+            }
     
     @property
     def addresses(self) -> List[str]:
@@ -73,8 +407,34 @@ class NasaPowerCities:
                 given city name in 'names' attribute. The corresponding value for each key is another
                 dict which contains the latitude and longitude values as float.
         """
-        return self._coordinates
-    
+        if self._lat is None:
+            return None
+        return {
+            city: {"latitude": self._lat[i], "longitude": self._lon[i]}
+            for city, i in self._name_index.items()
+            if not math.isnan(self._lat[i])
+        }
+
+    @property
+    def latitudes(self) -> array:
+        """
+        Retrieves the cities latitudes as a contiguous array of doubles, in the order of the 'names' attribute.
+
+        Returns:
+            array: A copy of the latitudes array, with NaN for the cities that were not geocoded.
+        """
+        return None if self._lat is None else array("d", self._lat)
+
+    @property
+    def longitudes(self) -> array:
+        """
+        Retrieves the cities longitudes as a contiguous array of doubles, in the order of the 'names' attribute.
+
+        Returns:
+            array: A copy of the longitudes array, with NaN for the cities that were not geocoded.
+        """
+        return None if self._lon is None else array("d", self._lon)
+
     @property
     def geodetails(self) -> Dict[str, dict]:
         """
@@ -95,98 +455,272 @@ class NasaPowerCities:
         Returns:
             Dict[str, dict]: A nested dictionary where the outer dict key is the 
                 given city name in 'names' attribute. The corresponding value for each key is the
-                response content from the NASA POWER climatology API endpoint.
+                response content from the NASA POWER climatology API endpoint for the "JSON" format,
+                or the path of the file the response was written to for other formats.
         """
         return self._climatologies
 
     def __str__(self) -> str:
         #* IMPROVE LAYOUT OF PRINT
-        cities_info = [
-            f"\t{city}, "
-            f"latitude={self._coordinates[city]['latitude'] if self._coordinates else None}, "
-            f"longitude={self._coordinates[city]['longitude'] if self._coordinates else None}\n" 
+        coordinates = self.coordinates or {}
+        cities_info = (
+            f"\t{city}, latitude={(c := coordinates.get(city, {})).get('latitude')}, longitude={c.get('longitude')}\n"
             for city in self._names
-        ]
-        return f"NasaPowerCities(\n{''.join(cities_info)})"
+        )
+        return "NasaPowerCities(\n" + "".join(cities_info) + ")"
+
+    def to_dataframe(self) -> "pandas.DataFrame":
+        """
+        Builds a table of the geocoded cities, with one row per city name that has coordinates.
+
+        Requires the optional 'pandas' dependency.
+
+        Returns:
+            pandas.DataFrame: A DataFrame with the name, address, latitude, longitude, osm_class,
+                osm_type, osm_id and osm_importance columns.
+
+        Raises:
+            ImportError: If pandas is not installed.
+            ValueError: If the geocoding details were not fetched yet.
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("'to_dataframe' requires pandas, install it with 'conda install pandas'.") from e
+        if self._georecords is None:
+            raise ValueError("Get the geocoding for the cities first using the 'get_geocoding_details' method.")
+        return pd.DataFrame.from_records(self._georecords)
     
 
+    def _index_names(self, coordinates: Optional[Dict[str, Dict[str, float]]]=None) -> None:
+        # Coordinates are stored as two parallel arrays of doubles (NaN when unknown) indexed by city name
+        self._name_index = {city: i for i, city in enumerate(self._names)}
+
+        # Names only differing by case or whitespace share a normalized key and are looked up once
+        self._name_keys = {city: _GeoCache.key(city) for city in self._name_index}
+        self._unique_names = {}
+        for city, key in self._name_keys.items():
+            self._unique_names.setdefault(key, city)
+        if coordinates is None:
+            self._lat = None
+            self._lon = None
+            return
+        self._lat = array("d", [math.nan]) * len(self._names)
+        self._lon = array("d", [math.nan]) * len(self._names)
+        for city, i in self._name_index.items():
+            if city in coordinates:
+                self._lat[i] = coordinates[city]["latitude"]
+                self._lon[i] = coordinates[city]["longitude"]
+
     @staticmethod
-    def _validate_names(names: Union[list, str]) -> list:
+    def _validate_names(names: Union[Iterable[str], str]) -> list:
         if isinstance(names, str):
             names = [names]
         if not isinstance(names, list):
-            raise TypeError(f"'names' must be a str or a list, received {type(names).__name__}")
+            try:
+                names = list(names)
+            except TypeError:
+                raise TypeError(f"'names' must be a str or an iterable of str, received {type(names).__name__}")
         
-        if not all([isinstance(city, str) for city in names]):
+        if not all(isinstance(city, str) for city in names):
             raise TypeError(f"All cities inside the 'names' list must be strings.")
         else:
             return names
         
-    def get_geocoding_details(self, min_delay_seconds: float=3, **kwargs):
+    @staticmethod
+    def _coerce_year(year: Any, name: str) -> Optional[int]:
+        if year is None or isinstance(year, int):
+            return year
+        try:
+            return int(year)
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"'{name}' must be of type int, received {type(year).__name__}") from e
+
+    def get_geocoding_details(self, min_delay_seconds: float=1, max_workers: Optional[int]=None, force: bool=False, **kwargs):
         """
         Retrieves geocoding details for the given cities and updates the relevant attributes.
 
+        City names are treated as equivalent regardless of case and surrounding whitespace, so
+        duplicates are only looked up once and share the same result. Cities resolved by a previous call
+        with the same options on this instance are kept as is unless 'force' is set, so adding a city only
+        looks up the new one.
+
+        Cities already present in the persistent geocoding cache are resolved locally. The remaining
+        lookups are dispatched concurrently on an asyncio event loop: requests are still started at
+        most once every 'min_delay_seconds', but their network latencies overlap. Each result is cached as
+        soon as its lookup completes and a failed lookup does not affect the others.
+
         Args:
-            timeout (int, optional): The maximum time to wait for geocoding results, in seconds. Defaults to 3.
-            min_delay_seconds (float, optional): The minimum delay between requests, in seconds. Defaults to 1.
-            **kwargs: Additional keyword arguments for geocoding.
+            min_delay_seconds (float, optional): The minimum delay between requests, in seconds. Defaults to 1, the Nominatim usage policy limit.
+            max_workers (Optional[int], optional): The maximum number of lookups in flight at once. Defaults to
+                None, which derives it from 'min_delay_seconds'.
+            force (bool, optional): Whether to resolve already resolved cities again, through the geocoding cache. Defaults to False.
+            **kwargs: Additional keyword arguments for geocoding (e.g. 'timeout', defaults to 10 seconds).
 
         Returns:
             None
         """
-        # Set the geocode object once with specified kwargs
-        geolocator = Nominatim(user_agent="NasaPowerCities")
-        geocode_kwargs = {k: v for k, v in kwargs.items()}
-        timeout_arg = geocode_kwargs.pop("timeout", 10)
-        custom_geocode = partial(geolocator.geocode, timeout=timeout_arg, **geocode_kwargs)
+        _run(self._get_geocoding_details_async(min_delay_seconds, max_workers, force, **kwargs))
+        print("Done!")
+
+    @classmethod
+    def _get_geolocator(cls) -> "Nominatim":
+        # Built once and reused so its HTTP session keeps the connection to Nominatim alive across calls
+        if cls._geolocator is None:
+            from geopy.adapters import AioHTTPAdapter
+            from geopy.geocoders import Nominatim
+
+            geolocator = Nominatim(user_agent="NasaPowerCities", adapter_factory=AioHTTPAdapter)
+            _ASYNC_CLEANUPS.append(lambda: geolocator.__aexit__(None, None, None))
+            cls._geolocator = geolocator
+        return cls._geolocator
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_rate_limited_geocode(cls, min_delay_seconds: float) -> "AsyncRateLimiter":
+        from geopy.extra.rate_limiter import AsyncRateLimiter
+
+        # One limiter per delay value, so that the delay also holds between consecutive calls.
+        # Errors are raised so that '_geocode_with_retries' can back off exponentially.
+        return AsyncRateLimiter(
+            cls._get_geolocator().geocode, min_delay_seconds=min_delay_seconds, max_retries=0, swallow_exceptions=False
+        )
+
+    @staticmethod
+    async def _geocode_with_retries(
+        geocode: "AsyncRateLimiter", city_name: str, **kwargs
+    ) -> Optional["Location"]:
+        from geopy.exc import GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable
+
+        for attempt in range(GEOCODE_MAX_RETRIES + 1):
+            try:
+                return await geocode(city_name, **kwargs)
+            except (GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable) as e:
+                if attempt == GEOCODE_MAX_RETRIES:
+                    raise
+                print(f"Transient geocoding error for {city_name}, retrying: {e}")
+                await asyncio.sleep(GEOCODE_BACKOFF_SECONDS * 2 ** attempt + random.random())
+
+    async def _get_geocoding_details_async(self, min_delay: float, max_workers: Optional[int], force: bool, **kwargs) -> None:
+        timeout_arg = kwargs.pop("timeout", 10)    # kwargs is already a fresh dict owned by this call
+
+        # Results of the previous call only stand for the same options, e.g. not for another 'language'
+        resolved = self._resolved if not force and kwargs == self._resolved_options else {}
+
+        # Resolve cached cities first, only the misses go to Nominatim
+        results = {}
+        pending = []
+        for key, city_name in self._unique_names.items():
+            if key in resolved:
+                results[key] = resolved[key]
+                continue
+            hit = self._geocache.get(city_name, kwargs)
+            if hit is not None and self._geocache.is_miss(hit):
+                print(f"Skipping {city_name}, its geocoding failed less than {GEOCACHE_MISS_TTL}s ago.")
+            elif hit is not None:
+                print(f"Using cached geocoding information for city of {city_name}...")
+                results[key] = hit
+            else:
+                pending.append(key)
+
+        if pending:
+            geocode = self._get_rate_limited_geocode(min_delay)
+
+            # Bound in-flight requests to what the rate limit allows so no backlog bursts into Nominatim
+            if max_workers is None:
+                max_workers = int(1 / min_delay) + 1 if min_delay > 0 else len(pending)
+            semaphore = asyncio.Semaphore(max(1, max_workers))
 
-        geocode = RateLimiter(custom_geocode, min_delay_seconds=min_delay_seconds)    # Single threaded request with 1s delay
+            async def _geocode_one(key: str) -> None:
+                city_name = self._unique_names[key]
+                async with semaphore:
+                    print(f"Fetching geocoding information for city of {city_name}...")
+                    try:
+                        location = await self._geocode_with_retries(geocode, city_name, timeout=timeout_arg, **kwargs)
+                    except Exception as e:
+                        print(f"Geocoding error for {city_name}: {e}")
+                        location = None
+                # Cached as soon as it completes, so an interrupted batch keeps its progress.
+                # Only proper geocodes are kept long term, misses expire quickly to be retried
+                if location is not None and location.latitude is not None:
+                    results[key] = self._geocache.set(city_name, location, kwargs)
+                else:
+                    self._geocache.set_miss(city_name, kwargs)
+
+            await asyncio.gather(*(_geocode_one(key) for key in pending))
 
         # Update addresses, coordinates, geodetails attributes from geocode query data
         addresses = []
-        coordinates_container = {}
+        lat = array("d", [math.nan]) * len(self._names)
+        lon = array("d", [math.nan]) * len(self._names)
         geodetails_container = {}
-        
+        georecords = []
+
         for city_name in self._names:
-            coordinates = {}
+            result = results.get(self._name_keys[city_name])
+            if result is None:
+                continue
+            address, latitude, longitude, raw = result
+            addresses.append(address)
+            i = self._name_index[city_name]
+            lat[i] = latitude
+            lon[i] = longitude
+            geodetails_container[city_name] = raw
+            georecords.append({
+                "name": city_name,
+                "address": address,
+                "latitude": latitude,
+                "longitude": longitude,
+                "osm_class": raw.get("class"),
+                "osm_type": raw.get("type"),
+                "osm_id": raw.get("osm_id"),
+                "osm_importance": raw.get("importance"),
+            })
 
-            print(f"Fetching geocoding information for city of {city_name}...")
-            try:
-                location = geocode(city_name)
-            except Exception as e:
-                print(e)
-            
-            if location:
-                addresses.append(location.address)
-                
-                coordinates["latitude"] = location.latitude
-                coordinates["longitude"] = location.longitude
-                coordinates_container[city_name] = coordinates
-
-                geodetails_container[city_name] = location.raw
-        
         self._addresses = addresses
-        self._coordinates = coordinates_container
+        self._lat = lat
+        self._lon = lon
         self._geodetails = geodetails_container
-        
-        print("Done!")
+        self._georecords = georecords
+        self._resolved = results
+        self._resolved_options = kwargs
 
     def fetch_climatology(self, 
         climate_params: List[str],
         community: str="SB",
         format: str="JSON",
         start: Optional[int]=None,
-        end: Optional[int]=None
+        end: Optional[int]=None,
+        max_workers: Optional[int]=None,
+        parameters_only: bool=False,
+        output_dir: Optional[Union[str, pathlib.Path]]=None
     ) -> None:
         """
         Fetches the climatology data for the given cities and parameters.
 
+        The parameters are split once into chunks of NASA_POWER_MAX_PARAMETERS (the API limit per query)
+        and one request is issued per (city, chunk) pair, cities at the same coordinates (e.g. duplicate
+        names) sharing the same requests and responses. For the "JSON" format, the chunks of a city
+        are merged back into a single response. Responses in other formats are streamed to files in
+        'output_dir' and 'climatologies' holds their paths, so large payloads are never held in memory.
+        The requests are issued concurrently, with at most 'max_workers' of them in flight and
+        NASA_POWER_MAX_CONNECTIONS open connections to the NASA POWER host. Cities with a failed request
+        are left out of 'climatologies'.
+
         Args:
-            climate_params (List[str]): A list of climatology parameters to fetch (maximum of 20).
+            climate_params (List[str]): A list of climatology parameters to fetch (maximum of 20 for formats other than "JSON").
             community (str, optional): The community for the query. Defaults to "SB".
             format (str, optional): The response format, either "JSON" or other formats. Defaults to "JSON".
             start (Optional[int], optional): The start year for the range. Must be specified with 'end'. Defaults to None.
             end (Optional[int], optional): The end year for the range. Must be specified with 'start'. Defaults to None.
+            max_workers (Optional[int], optional): The maximum number of requests in flight at once.
+                Defaults to None, which uses NASA_POWER_MAX_CONNECTIONS.
+            parameters_only (bool, optional): For the "JSON" format, only keep the 'properties.parameter' block
+                of each response (the values per parameter and period) and drop the geometry, header and
+                messages. Defaults to False.
+            output_dir (Optional[Union[str, pathlib.Path]], optional): The directory where responses in formats
+                other than "JSON" are written, cached responses downloaded elsewhere are copied there.
+                Defaults to None, which uses the 'climatologies' directory of the cache.
 
         Returns:
             None
@@ -198,8 +732,11 @@ class NasaPowerCities:
         # climate_params type and amount validation
         if not isinstance(climate_params, list):
             raise TypeError(f"'climate_params' must be of type list, received{type(climate_params).__name__}")
-        if len(climate_params) > 20:
-            raise ValueError("The number of climate_params should be less than or equal to 20.")
+        if format != "JSON" and len(climate_params) > NASA_POWER_MAX_PARAMETERS:
+            raise ValueError(
+                f"The number of climate_params should be less than or equal to {NASA_POWER_MAX_PARAMETERS} "
+                f"for formats other than JSON."
+            )
         
         if not isinstance(community, str) and not isinstance(format, str):
             raise TypeError(
@@ -207,14 +744,8 @@ class NasaPowerCities:
                 f"received{type(community).__name__} and {type(format).__name__} respectively"
             )
         # 'Start' and 'End' type/value validation
-        try:
-            start = int(start) if start is not None else None
-        except:
-            raise TypeError(f"'start' must be of type int, received {type(start).__name__}")
-        try:
-            end = int(end) if end is not None else None
-        except:
-            raise TypeError(f"'end' must be of type int, received {type(end).__name__}")
+        start = self._coerce_year(start, "start")
+        end = self._coerce_year(end, "end")
         if ((start is None and end is not None) or
             (start is not None and end is None)):
             raise ValueError("Both 'start' and 'end' should be None if no year range desired")
@@ -227,78 +758,185 @@ class NasaPowerCities:
             "parameters": ",".join(climate_params),
             "community": community,
             "format": format,
-            "start": start,
-            "end": end
         }
-        if start is None and end is None:
-            base_params.pop("start")
-            base_params.pop("end")
-        base_params_string = (
-            f"Preparing to fetch climatologies with base parameters:\n"
-            f"\t-parameters: {base_params['parameters']}\n"
-            f"\t-community: {base_params['community']}\n"
-            f"\t-format: {base_params['format']}"
+        if start is not None and end is not None:
+            base_params["start"] = start
+            base_params["end"] = end
+        print(
+            "Preparing to fetch climatologies with base parameters:\n"
+            + "\n".join(f"\t-{key}: {value}" for key, value in base_params.items())
         )
-        if "start" in base_params and "end" in base_params:
-            start_end_string = (
-                f"\t-start: {base_params['start']}\n"
-                f"\t-end: {base_params['end']}"
-            )
-            base_params_string += start_end_string
-        print(base_params_string)
 
-        # Prepare query params for each city        
-        params_cities = {}
-        if self._coordinates is None:
+        # Coordinates of each city, formatted once
+        coordinates_cities = {}
+        if self._lat is None:
             raise ValueError("Get the geocoding for the cities first using the 'get_geocoding_details' method.")
         for city in self._names:
-            if city not in self._coordinates:
+            i = self._name_index[city]
+            if math.isnan(self._lat[i]):
                 print(f"Will not fetch climatology for {city} since no valid coordinates.")
-            else:
-                base_params["latitude"] = self._coordinates[city]["latitude"]
-                base_params["longitude"] = self._coordinates[city]["longitude"]
+                continue
+            coordinates_cities[city] = {"latitude": f"{self._lat[i]:.4f}", "longitude": f"{self._lon[i]:.4f}"}
 
-            params_cities[city] = base_params
-        
-        # Multiple single-threaded queries for all cities within the object
-        url = "https://power.larc.nasa.gov/api/temporal/climatology/point"
-        climatologies = {}
-        
-        for city in params_cities:
-            try:
-                print(f"Fetching climatology for {city}...")
-                resp = requests.get(url, params=params_cities[city])
-                resp.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                print(f"Request error for {city}: {e}")
-            if format == "JSON":
+        # Chunk the parameters once and encode the query string shared by all cities once per chunk,
+        # each (city, chunk) pair is a single request
+        chunks = [",".join(chunk) for chunk in _chunked(climate_params, NASA_POWER_MAX_PARAMETERS)]
+        base_urls = {
+            chunk: NASA_POWER_CLIMATOLOGY_URL.with_query({**base_params, "parameters": chunk})
+            for chunk in chunks
+        }
+
+        # Concurrent queries for all cities within the object
+        output_dir = pathlib.Path(output_dir).resolve() if output_dir is not None else self._climfiles_dir
+        climatologies = _run(self._fetch_climatology_async(
+            coordinates_cities, base_urls, format, max_workers or NASA_POWER_MAX_CONNECTIONS, output_dir
+        ))
+        if parameters_only and format == "JSON":
+            parameters_cities = {}
+            for city, data in climatologies.items():
                 try:
-                    data = resp.json()
-                except Exception as e:
-                    print(f"Error parsing the data from {city}: {e}")
-            else:
-                data = resp.content
-            climatologies[city] = data
-            print("Done!")
-            time.sleep(1)    # Avoid API request limit errors
+                    parameters_cities[city] = data["properties"]["parameter"]
+                except (KeyError, TypeError) as e:
+                    print(f"Error parsing the data from {city}: unexpected response layout ({e!r})")
+            climatologies = parameters_cities
         self._climatologies = climatologies
+        print("Done!")
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        # Built once on the persistent event loop and reused so connections to NASA POWER stay alive across calls
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=2 * NASA_POWER_MAX_CONNECTIONS, limit_per_host=NASA_POWER_MAX_CONNECTIONS
+            )
+            session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=NASA_POWER_TIMEOUT)
+            )
+            _ASYNC_CLEANUPS.append(session.close)
+            cls._session = session
+        return cls._session
+
+    async def _fetch_climatology_async(self,
+        coordinates_cities: Dict[str, Dict[str, str]],
+        base_urls: Dict[str, yarl.URL],
+        format: str,
+        max_workers: int,
+        output_dir: pathlib.Path
+    ) -> Dict[str, Any]:
+        session = self._get_session()
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        # Pick the body handling and the chunks combiner once for the requested format. Other formats are
+        # streamed to a file named after the query, the cache then only holds the path of that file.
+        if format == "JSON":
+            parse, combine = _json_loads, _merge_climatologies
+            destination = lambda cache_key: None
+            restore = lambda data, cache_key: data
+        else:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            suffix = NASA_POWER_FILE_SUFFIXES.get(format.upper(), "." + format.lower())
+            parse, combine = (lambda path: path), (lambda responses: responses[0])
+            destination = lambda cache_key: output_dir / f"{cache_key}{suffix}"
+
+            def restore(data: Any, cache_key: str) -> Optional[pathlib.Path]:
+                # The file must end up in 'output_dir': one downloaded to another directory is copied over
+                # instead of being downloaded again, and a removed one is downloaded again
+                dest = destination(cache_key)
+                if dest.is_file():
+                    return dest
+                if not (isinstance(data, pathlib.Path) and data.is_file()):
+                    return None
+                try:
+                    shutil.copyfile(data, dest)
+                except OSError:
+                    return None
+                return dest
+
+        # Cities at the same (rounded) coordinates, e.g. duplicate names, send the exact same queries:
+        # each distinct query is only sent once and its response is shared by all of these cities
+        points = {}
+        for city, coordinates in coordinates_cities.items():
+            points.setdefault((coordinates["latitude"], coordinates["longitude"]), []).append(city)
+
+        async def _fetch_one(point: tuple, chunk: str) -> Any:
+            city = ", ".join(points[point])    # For the messages
+            latitude, longitude = point
+            url = base_urls[chunk].update_query(latitude=latitude, longitude=longitude)
+            cache_key = _climatology_cache_key(url)
+            data = self._climcache.get(cache_key)
+            if data is not None and (data := restore(data, cache_key)) is not None:
+                logger.info("Using cached climatology for %s", city)
+                return data
+            logger.info("Fetching climatology for %s", city)
+            try:
+                async with semaphore:
+                    body = await _get_with_retries(session, url, dest=destination(cache_key))
+                data = parse(body)
+                self._climcache.set(cache_key, data, expire=CLIMCACHE_TTL)
+                return data
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Request error for {city}: {str(e) or type(e).__name__}")
+            except OSError as e:
+                print(f"Error writing the data from {city}: {e}")
+            except ValueError as e:
+                print(f"Error parsing the data from {city}: {e}")
+            return None
+
+        requests_matrix = [(point, chunk) for point in points for chunk in base_urls]
+        responses = await asyncio.gather(*(_fetch_one(point, chunk) for point, chunk in requests_matrix))
+
+        # Group the chunk responses back by point, a point is only kept if all of its chunks succeeded
+        responses_points = {}
+        for (point, _), data in zip(requests_matrix, responses):
+            responses_points.setdefault(point, []).append(data)
+
+        climatologies_points = {}
+        for point, point_responses in responses_points.items():
+            if any(data is None for data in point_responses):
+                continue
+            try:
+                climatologies_points[point] = combine(point_responses)
+            except (KeyError, TypeError, AttributeError) as e:
+                print(f"Error parsing the data from {', '.join(points[point])}: unexpected response layout ({e!r})")
+
+        # Back to one entry per city, in the order of 'names'
+        climatologies = {}
+        for city, coordinates in coordinates_cities.items():
+            point = (coordinates["latitude"], coordinates["longitude"])
+            if point in climatologies_points:
+                climatologies[city] = climatologies_points[point]
+        return climatologies
 
 def get_nasapower_params(
             url: str="https://power.larc.nasa.gov/#resources", 
             webdriver_timeout: Union[float, int]=10,
             ele_id: str="parameterDictSelect",
+            api_url: str=NASA_POWER_PARAMETERS_URL,
+            community: str="SB",
+            reuse_driver: Optional["webdriver.Firefox"]=None,
+            cache_dir: Optional[Union[str, pathlib.Path]]=None,
         ) -> Dict[str, str]:
         """
-        Retrieves NASA power parameters from the specified URL.
+        Retrieves the NASA POWER climatology parameters.
+
+        The parameters are requested directly from the NASA POWER system manager API. If that fails,
+        they are scraped client-side from the 'ele_id' dropdown of 'url' with Selenium and Firefox.
+        Since the list rarely changes, the result is memoized in-process and cached on disk
+        (in the 'paramcache' directory of 'cache_dir') for PARAMCACHE_TTL seconds.
 
         Args:
-            url (str, optional): The URL to scrape. Defaults to "https://power.larc.nasa.gov/#resources".
+            url (str, optional): The URL to scrape as a fallback. Defaults to "https://power.larc.nasa.gov/#resources".
             webdriver_timeout (Union[float, int], optional): The maximum time to wait for the webdriver, in seconds. Defaults to 10.
-            tag_name (str, optional): The HTML tag name to look for. Defaults to "option".
-            skip (bool, optional): Whether to skip this operation. Defaults to True.
+            ele_id (str, optional): The id of the select element listing the parameters. Defaults to "parameterDictSelect".
+            api_url (str, optional): The NASA POWER parameters API endpoint. Defaults to NASA_POWER_PARAMETERS_URL.
+            community (str, optional): The community to list the parameters for. Defaults to "SB".
+            reuse_driver (Optional[webdriver.Firefox], optional): An already opened Firefox webdriver to scrape with,
+                left open afterwards. Defaults to None, which starts (and then quits) a headless Firefox.
+            cache_dir (Optional[Union[str, pathlib.Path]], optional): The root directory of the persistent parameters
+                cache ('paramcache'). Defaults to '~/.nasa_power_query'.
 
         Returns:
-            List[str]: A list of NASA power parameters.
+            Dict[str, str]: A dictionary mapping the NASA POWER parameters abbreviations to their long names.
         """
         if not isinstance(url, str):
             raise TypeError(f"'url' must be a str, received {type(url).__name__}")
@@ -306,43 +944,115 @@ def get_nasapower_params(
             webdriver_timeout = float(webdriver_timeout)
         except:
             raise TypeError(f"'webdriver_timeout' must be a float or int, received {type(webdriver_timeout).__name__}")
-        
-        # Perform client-side tag scraping
-        print("Opening FireFox webdriver with Selenium 4...")
-        driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()))
+
+        key = (api_url, community, url, ele_id)
+        if key in _NASAPOWER_PARAMS_MEMO:
+            return dict(_NASAPOWER_PARAMS_MEMO[key])
+        cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        with Cache(str(cache_dir / "paramcache")) as cache:
+            power_param_dict = cache.get(key)
+        if power_param_dict is not None:
+            print("Using cached NASA POWER climatology parameters...")
+            _NASAPOWER_PARAMS_MEMO[key] = power_param_dict
+            return dict(power_param_dict)
+
+        print(f"Requesting {api_url} for the climatology parameters...")
         try:
-            print(f"Requesting {url} for client-side scrapping...")
-            driver.get(url=url)    # Navigate to url
-            # Wait for select id tag to load before getting the source
-            WebDriverWait(driver=driver, timeout=webdriver_timeout).until(
-                EC.presence_of_element_located((By.ID, ele_id))
-            )
-            html = driver.page_source
-            print(f"Full client-side rendered containing {ele_id} options.")
-            
-            # Extract all option from the select dropdown
-            select_element = driver.find_element(By.ID, ele_id) 
-            select = Select(select_element)
-            # Wait for at least two option to be loaded within the select element
-            WebDriverWait(driver, timeout=webdriver_timeout).until(
-                lambda x: len(select.options) > 2
-            )
-            
+            power_param_dict = _run(_fetch_nasapower_params(api_url, community))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, TypeError, KeyError) as e:
+            print(f"Could not get the parameters from the NASA POWER API, falling back to scraping: {e}")
             power_param_dict = {}
-            for option in select.options:
-                short_name = option.get_attribute("value")    # Abbreviation for the POWER params
-                long_name = option.text    # Long name for the POWER params
-                # Skip the option if it has no value or a specific text
-                if short_name and long_name != "Select a parameter...":
-                    power_param_dict[short_name] = long_name
+        else:
+            if not power_param_dict:
+                print("No parameters from the NASA POWER API, falling back to scraping.")
+        if not power_param_dict:
+            power_param_dict = _scrape_nasapower_params(url, webdriver_timeout, ele_id, reuse_driver)
+
+        # Failed fetches are not cached so that the next call tries again
+        if power_param_dict:
+            with Cache(str(cache_dir / "paramcache")) as cache:
+                cache.set(key, power_param_dict, expire=PARAMCACHE_TTL)
+            _NASAPOWER_PARAMS_MEMO[key] = power_param_dict
+        return dict(power_param_dict)
+
+
+async def _fetch_nasapower_params(api_url: str, community: str) -> Dict[str, str]:
+    session = NasaPowerCities._get_session()
+    body = await _get_with_retries(session, api_url, params={"community": community, "temporal": "climatology"})
+    data = _json_loads(body)
+    # The API lists the parameters either keyed by abbreviation or as a list of records
+    if isinstance(data, dict):
+        return {abbreviation: info["name"] for abbreviation, info in data.items()}
+    return {param["abbreviation"]: param["name"] for param in data if param.get("abbreviation")}
+
+
+def _get_geckodriver_path() -> str:
+    global _GECKODRIVER_PATH
+    if _GECKODRIVER_PATH is None:
+        from webdriver_manager.firefox import GeckoDriverManager
+        _GECKODRIVER_PATH = GeckoDriverManager().install()
+    return _GECKODRIVER_PATH
+
+
+def _scrape_nasapower_params(
+    url: str,
+    webdriver_timeout: float,
+    ele_id: str,
+    reuse_driver: Optional["webdriver.Firefox"]=None
+) -> Dict[str, str]:
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        from selenium.webdriver.support.wait import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import Select
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import NoSuchElementException, TimeoutException
+    except ImportError as e:
+        raise ImportError(
+            "Scraping the parameters requires selenium, install it with 'conda install selenium webdriver-manager'."
+        ) from e
+
+    # Perform client-side tag scraping
+    if reuse_driver is not None:
+        driver = reuse_driver
+    else:
+        print("Opening headless FireFox webdriver with Selenium 4...")
+        options = webdriver.FirefoxOptions()
+        options.add_argument("-headless")
+        driver = webdriver.Firefox(service=FirefoxService(_get_geckodriver_path()), options=options)
+    power_param_dict = {}
+    try:
+        print(f"Requesting {url} for client-side scrapping...")
+        driver.get(url=url)    # Navigate to url
+        # Wait for select id tag to load before getting the source
+        WebDriverWait(driver=driver, timeout=webdriver_timeout).until(
+            EC.presence_of_element_located((By.ID, ele_id))
+        )
+        html = driver.page_source
+        print(f"Full client-side rendered containing {ele_id} options.")
         
-        except NoSuchElementException as e:
-            print(f"Could not find element of {id=}: Error {e}")
-        except TimeoutException as e:
-            print(f"Timed out waiting for element with ID '{ele_id}' to load. Error: {e}")
-        finally:
-            driver.quit()
+        # Extract all option from the select dropdown
+        select_element = driver.find_element(By.ID, ele_id) 
+        select = Select(select_element)
+        # Wait for at least two option to be loaded within the select element
+        WebDriverWait(driver, timeout=webdriver_timeout).until(
+            lambda x: len(select.options) > 2
+        )
         
-        return power_param_dict
-
-        
\ No newline at end of file
+        for option in select.options:
+            short_name = option.get_attribute("value")    # Abbreviation for the POWER params
+            long_name = option.text    # Long name for the POWER params
+            # Skip the option if it has no value or a specific text
+            if short_name and long_name != "Select a parameter...":
+                power_param_dict[short_name] = long_name
+    
+    except NoSuchElementException as e:
+        print(f"Could not find element of {id=}: Error {e}")
+    except TimeoutException as e:
+        print(f"Timed out waiting for element with ID '{ele_id}' to load. Error: {e}")
+    finally:
+        if reuse_driver is None:
+            driver.quit()
+    
+    return power_param_dict